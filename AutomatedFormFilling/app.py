@@ -1,167 +1,335 @@
 import streamlit as st
+import pandas as pd
 import openai
-import json
-import requests
+import orjson
+import httpx
 from fpdf import FPDF
-import tempfile
 import os
+import logging
+import queue
+import threading
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
 import sounddevice as sd
 import numpy as np
-import wave
 from google.cloud import speech
-import base64
+from google.oauth2 import service_account
+import pybase64
 
-# Decode base64-encoded credentials and load JSON
-import base64
+# Debug output is off unless LOG_LEVEL=DEBUG is set; arguments aren't even formatted at WARNING
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"))
+log = logging.getLogger("form")
 
-# Decode base64-encoded credentials and load JSON
-credentials_b64 = st.secrets["GOOGLE_CREDENTIALS_BASE64"]
-credentials_json = base64.b64decode(credentials_b64).decode("utf-8")
-credentials_dict = json.loads(credentials_json)
+# Decode base64-encoded credentials and load JSON; whitespace is stripped so line-wrapped secrets still validate
+credentials_b64 = "".join(st.secrets["GOOGLE_CREDENTIALS_BASE64"].split())
+credentials_dict = orjson.loads(pybase64.b64decode(credentials_b64, validate=True))
 
-# Write the credentials to a temp file
-with tempfile.NamedTemporaryFile(delete=False, mode="w", suffix=".json") as temp_cred_file:
-    json.dump(credentials_dict, temp_cred_file)
-    GOOGLE_CREDENTIALS_PATH = temp_cred_file.name
+GEMINI_API_KEY = st.secrets["GEMINI_API_KEY"]
 
+SAMPLE_RATE = 16000
+CHUNK_SIZE = SAMPLE_RATE // 10  # 100 ms of audio per streaming request
+MAX_RECORDING_SECONDS = 10
+VAD_FRAME_SIZE = SAMPLE_RATE // 50  # 20 ms frames for voice activity detection
+# Mean absolute int16 amplitude of a frame that counts as speech; kept low for quiet speakers and
+# low-gain microphones, and can be tuned per machine with the VAD_THRESHOLD environment variable
+VAD_THRESHOLD = int(os.environ.get("VAD_THRESHOLD", 150))
+VAD_TRAILING_CHUNKS = 10  # Stop sending after 1 s of silence once speech has started
 
-GEMINI_API_KEY = st.secrets["GEMINI_API_KEY"]
+GEMINI_MODEL = "gemini-1.5-flash"  # Short slot-filling only needs the low-latency model
+GEMINI_FALLBACK_MODEL = "gemini-1.5-pro"  # Retried when the flash reply can't be parsed
+
+class Question(NamedTuple):
+    question: str
+    type: str
 
-questions = [
-    {"question": "Name", "type": "text"},
-    {"question": "Age", "type": "number"},
-    {"question": "Address", "type": "text"},
-    {"question": "Contact number", "type": "number"},
-    {"question": "Occupation", "type": "text"},
-    {"question": "Socioeconomic status", "type": "text"},
-    {"question": "Nearest health center", "type": "text"},
-    {"question": "Time taken to reach health center", "type": "number"},
-    {"question": "Means of transport to health center", "type": "text"},
-]
+QUESTIONS = (
+    Question("Name", "text"),
+    Question("Age", "number"),
+    Question("Address", "text"),
+    Question("Contact number", "number"),
+    Question("Occupation", "text"),
+    Question("Socioeconomic status", "text"),
+    Question("Nearest health center", "text"),
+    Question("Time taken to reach health center", "number"),
+    Question("Means of transport to health center", "text"),
+)
+
+# Gemini prompt prefix and generation config for each starting step, built once so a call
+# only appends the transcript. The configs are shared between calls and must not be mutated.
+PROMPT_PREFIXES = tuple(
+    "You are filling out a medical form. Extract the answers to the questions "
+    + ", ".join(f"'{q.question}' ({q.type})" for q in QUESTIONS[step:])
+    + " from this text, leaving a question empty if the text does not answer it: "
+    for step in range(len(QUESTIONS))
+)
+GENERATION_CONFIGS = tuple(
+    {
+        "temperature": 0,
+        "maxOutputTokens": 256,  # Bounds decode time; answers are a few words each
+        "responseMimeType": "application/json",
+        "responseSchema": {
+            "type": "OBJECT",
+            "properties": {q.question: {"type": "STRING"} for q in QUESTIONS[step:]},
+        },
+    }
+    for step in range(len(QUESTIONS))
+)
 
 # Ensure session state variables exist
 if "current_step" not in st.session_state:
     st.session_state["current_step"] = 0
-if "responses" not in st.session_state:
-    st.session_state["responses"] = {}
+for idx in range(len(QUESTIONS)):
+    st.session_state.setdefault(f"resp_{idx}", "")  # Answer to QUESTIONS[idx]
 if "recording_active" not in st.session_state:
     st.session_state["recording_active"] = False
 
-# Function to record audio dynamically
-def record_audio(filename):
-    samplerate = 16000
-    duration = 10  # Maximum duration in seconds
-    st.sidebar.write("Recording... Click 'Stop Recording' when done.")
-    st.session_state["recording"] = sd.rec(int(samplerate * duration), samplerate=samplerate, channels=1, dtype=np.int16)
+# Function to record audio dynamically and stream it to Google Speech-to-Text
+def record_audio():
+    audio_queue = queue.Queue()
+    stream = sd.RawInputStream(
+        samplerate=SAMPLE_RATE,
+        channels=1,
+        dtype='int16',
+        blocksize=CHUNK_SIZE,
+        callback=lambda indata, frames, time, status: audio_queue.put(bytes(indata))
+    )
+    stream.start()
+    st.session_state["audio_stream"] = stream
+    st.session_state["audio_queue"] = audio_queue
+    st.session_state["transcript"] = ""
+    st.session_state.pop("prefetch", None)
     st.session_state["recording_active"] = True
 
-# Function to stop recording and save file
-def stop_recording(filename):
+    st.sidebar.write("Recording... Click 'Stop Recording' when done.")
+    transcribe_audio_google(audio_queue, st.sidebar.empty())
+
+    # The utterance ended on its own, so finish up as if Stop had been clicked
+    stop_recording()
+
+# Function to stop recording and process the transcript
+def stop_recording():
     if "recording_active" in st.session_state and st.session_state["recording_active"]:
-        sd.stop()
-        with wave.open(filename, 'wb') as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(16000)
-            wf.writeframes(st.session_state["recording"].tobytes())
+        st.session_state["audio_stream"].stop()
+        st.session_state["audio_stream"].close()
+        st.session_state["audio_queue"].put(None)  # Ends the streaming request generator
         st.session_state["recording_active"] = False
 
-        # Get transcription and process answer
-        transcript = transcribe_audio_google(filename)
-        extracted_info = process_with_gemini(transcript, questions[st.session_state["current_step"]])
+        # Use the last transcript received while streaming, reusing the prefetched
+        # extraction when it was made from that same transcript
+        transcript = st.session_state["transcript"]
+        future = None
+        prefetch = st.session_state.pop("prefetch", None)
+        if prefetch is not None:
+            with prefetch["lock"]:
+                prefetch["pending"] = None  # Nothing is resubmitted once recording has stopped
+                if prefetch["transcript"] == transcript:
+                    future = prefetch["future"]
+        if future is not None:
+            extracted_info = future.result()
+        else:
+            extracted_info = process_with_gemini(transcript, st.session_state["current_step"])
+
+        # Save every answer the transcript covered, not just the current question's
+        for idx, answer in enumerate(extracted_info, start=st.session_state["current_step"]):
+            if answer:
+                st.session_state[f"resp_{idx}"] = answer
+                st.session_state[f"input_{idx}"] = answer  # Shows it in the input when that question is current
 
-        # Save the extracted answer
-        current_question = questions[st.session_state["current_step"]]["question"]
-        st.session_state["responses"][current_question] = extracted_info  
+        # Move to the next question that is still unanswered, or just the next one when the rest are
+        # all answered; the form below renders after this
+        for idx in range(st.session_state["current_step"] + 1, len(QUESTIONS)):
+            if not st.session_state[f"resp_{idx}"]:
+                st.session_state["current_step"] = idx
+                break
+        else:
+            st.session_state["current_step"] = min(st.session_state["current_step"] + 1, len(QUESTIONS) - 1)
 
-        # Move to next question
-        if st.session_state["current_step"] < len(questions) - 1:
-            st.session_state["current_step"] += 1
-            st.rerun()  # This forces the UI to update with the new current_step
+# Build the Speech client once per process so the gRPC channel and auth token are reused
+@st.cache_resource
+def get_speech_client():
+    credentials = service_account.Credentials.from_service_account_info(credentials_dict)
+    return speech.SpeechClient(credentials=credentials)
 
-        os.remove(filename)
+# Shared HTTP/2 client so Gemini calls, including concurrent prefetches, multiplex over one connection
+@st.cache_resource
+def gemini_http():
+    return httpx.Client(http2=True, timeout=30, headers={"Content-Type": "application/json"})
 
-# Function to process audio input via Google Speech-to-Text
-def transcribe_audio_google(audio_file):
+# Worker threads for Gemini requests made while audio is still streaming
+@st.cache_resource
+def get_gemini_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+# Start extracting the answer from an interim transcript while the user is still speaking.
+# Only one request runs at a time; the newest transcript that arrives meanwhile is kept as
+# pending and submitted as soon as the running request finishes.
+def prefetch_extraction(transcript):
+    prefetch = st.session_state.setdefault(
+        "prefetch", {"lock": threading.RLock(), "transcript": None, "future": None, "pending": None}
+    )
+    with prefetch["lock"]:
+        if transcript == (prefetch["pending"] or prefetch["transcript"]):
+            return
+        future = prefetch["future"]
+        if future is not None and not (future.cancel() or future.done()):
+            prefetch["pending"] = transcript
+            return
+        _submit_prefetch(prefetch, get_gemini_executor(), transcript, st.session_state["current_step"])
+
+# Caller holds prefetch["lock"]; the done callback runs on a worker thread, so it only touches the prefetch dict
+def _submit_prefetch(prefetch, executor, transcript, step):
+    future = executor.submit(process_with_gemini, transcript, step)
+    prefetch.update(transcript=transcript, pending=None, future=future)
+    future.add_done_callback(lambda _: _resubmit_pending(prefetch, executor, step))
+
+def _resubmit_pending(prefetch, executor, step):
+    with prefetch["lock"]:
+        if prefetch["pending"] is not None and prefetch["future"].done():
+            _submit_prefetch(prefetch, executor, prefetch["pending"], step)
+
+# Energy-based voice activity check over the 20 ms frames of a raw PCM chunk
+def contains_speech(chunk):
+    pcm = np.frombuffer(chunk, dtype=np.int16)
+    frames = pcm[:len(pcm) // VAD_FRAME_SIZE * VAD_FRAME_SIZE].reshape(-1, VAD_FRAME_SIZE)
+    return bool((np.abs(frames, dtype=np.int32).mean(axis=1) > VAD_THRESHOLD).any())
+
+# Yield 100 ms audio chunks from the microphone queue until recording stops,
+# skipping leading silence and ending after trailing silence
+def audio_chunks(audio_queue):
+    previous_chunk = None
+    speech_started = False
+    silent_chunks = 0
+    for _ in range(MAX_RECORDING_SECONDS * SAMPLE_RATE // CHUNK_SIZE):
+        chunk = audio_queue.get()
+        if chunk is None:
+            return
+
+        if contains_speech(chunk):
+            if not speech_started and previous_chunk is not None:
+                # Keep one chunk before the onset so the first syllable isn't clipped
+                yield speech.StreamingRecognizeRequest(audio_content=previous_chunk)
+            speech_started = True
+            silent_chunks = 0
+        elif not speech_started:
+            previous_chunk = chunk
+            continue
+        else:
+            silent_chunks += 1
+            if silent_chunks > VAD_TRAILING_CHUNKS:
+                return
+
+        yield speech.StreamingRecognizeRequest(audio_content=chunk)
+
+# Function to stream audio to Google Speech-to-Text, showing partial transcripts as they arrive
+def transcribe_audio_google(audio_queue, placeholder):
     try:
-        client = speech.SpeechClient.from_service_account_json(GOOGLE_CREDENTIALS_PATH)
-        with open(audio_file, "rb") as f:
-            content = f.read()
-        
-        audio = speech.RecognitionAudio(content=content)
-        config = speech.RecognitionConfig(
-            encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-            sample_rate_hertz=16000,
-            language_code="en-US"
+        client = get_speech_client()
+        streaming_config = speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                sample_rate_hertz=SAMPLE_RATE,
+                language_code="en-US"
+            ),
+            interim_results=True,
+            single_utterance=True
         )
-        
-        response = client.recognize(config=config, audio=audio)
-        return response.results[0].alternatives[0].transcript if response.results else ""
+
+        responses = client.streaming_recognize(streaming_config, audio_chunks(audio_queue))
+        for response in responses:
+            for result in response.results:
+                # Keep the latest transcript in session state so Stop can finalize it
+                st.session_state["transcript"] = result.alternatives[0].transcript
+                placeholder.markdown(f"_{st.session_state['transcript']}_")
+                prefetch_extraction(st.session_state["transcript"])
+                if result.is_final:
+                    return st.session_state["transcript"]
     except Exception as e:
-        print("Error in transcription:", e)
-        return ""
+        log.error("Error in transcription: %s", e)
 
-# Function to extract relevant medical info using Gemini
-def process_with_gemini(text, question):
+    if not st.session_state["transcript"]:
+        placeholder.warning("No speech was detected. Try speaking louder or closer to the microphone.")
+    return st.session_state["transcript"]
+
+# Single Gemini request returning one answer per question from `step` on; raises ValueError on an unusable reply
+def _gemini_request(model, step, text):
+    url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={GEMINI_API_KEY}"
+    payload = {
+        "contents": [{"parts": [{"text": PROMPT_PREFIXES[step] + text}]}],
+        "generationConfig": GENERATION_CONFIGS[step],
+    }
+
+    response = gemini_http().post(url, content=orjson.dumps(payload))
+    response_json = orjson.loads(response.content)
+
+    log.debug("Gemini API Response: %s", response_json)
+
+    # Extract the response properly
+    if "candidates" in response_json and response_json["candidates"]:
+        extracted_text = response_json["candidates"][0]["content"]["parts"][0]["text"]
+        log.debug("Extracted Info: %s", extracted_text)
+        answers = orjson.loads(extracted_text)
+        return [str(answers.get(q.question, "")).strip() for q in QUESTIONS[step:]]
+
+    raise ValueError("No valid response from Gemini")
+
+# Cached Gemini call keyed on the starting step and the transcript; failures raise so they are never cached
+@st.cache_data(ttl=3600, show_spinner=False)
+def _gemini_extract(step, text):
+    try:
+        return _gemini_request(GEMINI_MODEL, step, text)
+    except ValueError as e:
+        log.warning("Falling back to %s after: %s", GEMINI_FALLBACK_MODEL, e)
+        return _gemini_request(GEMINI_FALLBACK_MODEL, step, text)
+
+# Function to extract answers to the questions from `step` on from one transcript with a single Gemini call.
+# Returns one answer per question, in order.
+def process_with_gemini(text, step):
     try:
-        url = f"https://generativelanguage.googleapis.com/v1/models/gemini-1.5-pro:generateContent?key={GEMINI_API_KEY}"
-        headers = {"Content-Type": "application/json"}
-        
-        payload = {
-            "contents": [{"parts": [{"text": f"You are filling out a medical form. Extract the relevant answer for the question '{question['question']}' which requires a {question['type']} response, from this text: {text}"}]}]
-        }
-
-        response = requests.post(url, headers=headers, json=payload)
-        response_json = response.json()
-
-        print("Gemini API Response:", response_json)  # Debugging statement
-
-        # Extract the response properly
-        if "candidates" in response_json and response_json["candidates"]:
-            extracted_text = response_json["candidates"][0]["content"]["parts"][0]["text"]
-            print("Extracted Info:", extracted_text)  # Debugging statement
-            return extracted_text.strip()
-
-        print("Error: No valid response from Gemini")
-        return "Error: No valid response from Gemini"
+        return _gemini_extract(step, text)
     except Exception as e:
-        print("Error in Gemini API:", e)
-        return f"Error: {e}"
+        log.error("Error in Gemini API: %s", e)
+        return [f"Error: {e}"] + [""] * (len(QUESTIONS) - step - 1)
 
 # Streamlit UI
 st.title("Medical Questionnaire - Voice Input System")
 
 # Always-visible microphone button
 st.sidebar.header("Voice Input")
-recording_file = "temp_recording.wav"
 if st.sidebar.button("Start Recording"):
-    record_audio(recording_file)
+    record_audio()
 if st.sidebar.button("Stop Recording"):
-    stop_recording(recording_file)
-
-# Display questions and progress - KEEPING ORIGINAL INTERFACE
-for idx, item in enumerate(questions):
-    st.subheader(item["question"])
-    if idx == st.session_state["current_step"]:
-        # Highlight current question and show input field with extracted answer
-        st.session_state["responses"][item["question"]] = st.text_input(
-            "Answer:",
-            key=f"input_{idx}",  # Unique key per question
-            value=st.session_state["responses"].get(item["question"], ""),
-        )
-    else:
-        # Show non-current questions as read-only
-        st.text_input(
-            "Answer:",
-            value=st.session_state["responses"].get(item["question"], ""),
-            key=f"display_{idx}",
-            disabled=True
-        )
+    stop_recording()
 
-st.progress((st.session_state["current_step"] + 1) / len(questions))
+# Copy an edited answer out of its widget; widget state is dropped once the question is no longer shown
+def save_answer(idx):
+    st.session_state[f"resp_{idx}"] = st.session_state[f"input_{idx}"]
 
-# Function to export the form as a PDF
-def export_to_pdf():
+# The answers table and the current question's input are a fragment, so typing an answer
+# doesn't rerun the whole page but still refreshes its row in the table
+@st.fragment
+def current_question_ui():
+    # Display all answers so far as one read-only table, then the current question
+    st.dataframe(
+        pd.DataFrame(
+            [(item.question, st.session_state[f"resp_{idx}"]) for idx, item in enumerate(QUESTIONS)],
+            columns=["Question", "Answer"]
+        ),
+        hide_index=True,
+        width="stretch"
+    )
+    idx = st.session_state["current_step"]
+    st.subheader(QUESTIONS[idx].question)
+    # Show input field with extracted answer
+    st.session_state.setdefault(f"input_{idx}", st.session_state[f"resp_{idx}"])
+    st.text_input("Answer:", key=f"input_{idx}", on_change=save_answer, args=(idx,))
+
+current_question_ui()
+
+st.progress((st.session_state["current_step"] + 1) / len(QUESTIONS))
+
+# Function to build the PDF in memory; cached so repeated exports of the same answers reuse the bytes
+@st.cache_data(show_spinner=False)
+def render_pdf(responses):
     pdf = FPDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
@@ -169,16 +337,17 @@ def export_to_pdf():
     pdf.cell(200, 10, "Medical Questionnaire Report", ln=True, align='C')
     pdf.ln(10)
     
-    for q, a in st.session_state["responses"].items():
+    for q, a in responses:
         pdf.multi_cell(0, 10, f"{q}: {a}")
         pdf.ln()
     
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-        pdf.output(tmp_file.name)
-        tmp_file.close()
-        with open(tmp_file.name, "rb") as file:
-            st.download_button("Download PDF", file, file_name="medical_report.pdf", mime="application/pdf")
-        os.remove(tmp_file.name)
+    return pdf.output(dest='S').encode("latin-1")
+
+# Function to export the form as a PDF
+def export_to_pdf():
+    responses = {item.question: st.session_state.get(f"resp_{idx}", "") for idx, item in enumerate(QUESTIONS)}
+    pdf_bytes = render_pdf(tuple(responses.items()))
+    st.download_button("Download PDF", pdf_bytes, file_name="medical_report.pdf", mime="application/pdf")
 
 # Export Button
 if st.button("Export Report as PDF"):
@@ -1,17 +1,23 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import folium
-from folium.plugins import MarkerCluster
-from streamlit_folium import folium_static
+from folium.plugins import FastMarkerCluster
 from geopy.distance import geodesic
 import urllib.parse
 import os
-import time
 import re
-import polyline
+import threading
+import functools
+import inspect
+import diskcache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Set page configuration
 st.set_page_config(
@@ -31,7 +37,46 @@ Simply select a location on the map or enter an address, and the app will search
 RADIUS_KM = 25  # Search radius in kilometers (increased to find hospitals within 1-hour travel time)
 RADIUS_METERS = RADIUS_KM * 1000  # Convert to kilometers for Google API
 MAX_RESULTS = 20  # Maximum number of results to return per API call
+# Nearby-search queries issued concurrently and merged; each returns at most MAX_RESULTS places
+NEARBY_SEARCH_QUERIES = [
+    (("hospital",), "POPULARITY"),
+    (("hospital",), "DISTANCE")
+]
 MAX_TRAVEL_TIME_SECONDS = 3600  # 1 hour in seconds
+MAX_API_WORKERS = 16  # Threads for concurrent Google API calls, shared by all sessions
+MATRIX_MAX_DESTINATIONS = 25  # Destinations per computeRouteMatrix request
+FAST_CLUSTER_THRESHOLD = MAX_RESULTS  # Above one query's worth of hospitals, markers are built in the browser by FastMarkerCluster
+SEARCH_RADIUS_SLACK = 1.3  # Road distance allowance over the straight-line search radius
+KM_PER_DEGREE_LAT = 111.0
+MAX_ROAD_SPEED_KMH = 120  # Upper bound on average driving speed, used to skip unreachable hospitals
+EARTH_RADIUS_KM = 6371.0
+ROUTE_SIMPLIFY_TOLERANCE = 1e-4  # Degrees (~10 m); route points closer than this to the simplified line are dropped
+DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hc_cache")
+DISK_CACHE_SIZE_LIMIT = 1 << 30  # 1 GB
+SAMPLE_LOCATIONS = [
+    "Gurgaon, Haryana",
+    "Ahmedabad, Gujarat",
+    "Vijayawada, Andhra Pradesh",
+    "Siliguri, West Bengal",
+    "Kochi, Kerala"
+]
+# Name keywords that suggest a hospital's size and services, compiled once into single-pass patterns
+MULTISPECIALITY_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in [
+        'multi', 'general', 'district', 'medical center', 'medical college',
+        'aiims', 'government', 'state', 'university', 'memorial'
+    ]),
+    re.IGNORECASE
+)
+EMERGENCY_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in [
+        'emergency', 'trauma', 'accident', '24 hour', '24/7', 'critical care', 'casualty'
+    ]),
+    re.IGNORECASE
+)
+EMERGENCY_TYPES = {'emergency_room', 'emergency_service', 'trauma_center'}
+# Hospital list icons, in display order; a hospital's 'category' indexes into this
+HOSPITAL_CATEGORY_ICONS = ["🚑", "📋", "🏥"]
 
 # API Key - Using Streamlit secrets
 API_KEY = st.secrets["api_key"]
@@ -49,86 +94,229 @@ def format_address(address_components):
     
     return ", ".join(formatted)
 
+@st.cache_resource
+def get_http_session():
+    """Shared HTTP session so Google API calls reuse pooled keep-alive connections across reruns"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST"]  # Routes API POSTs are read-only queries, safe to retry
+    )
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource
+def get_disk_cache():
+    """Disk-backed cache shared by all sessions, so API results survive restarts and redeploys"""
+    return diskcache.Cache(DISK_CACHE_DIR, size_limit=DISK_CACHE_SIZE_LIMIT)
+
+_MISSING = object()
+
+def disk_cached(expire):
+    """Persist a function's results in the disk cache for expire seconds.
+    As with st.cache_data, arguments starting with an underscore are left out of the key."""
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__,) + tuple(
+                value for name, value in bound.arguments.items() if not name.startswith("_")
+            )
+            
+            cache = get_disk_cache()
+            result = cache.get(key, default=_MISSING)
+            if result is _MISSING:
+                # Exceptions propagate before this point, so failed calls are never stored
+                result = func(*args, **kwargs)
+                cache.set(key, result, expire=expire)
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+@st.cache_resource
+def get_executor():
+    """Worker threads for concurrent Google API calls, created once and reused across reruns"""
+    return ThreadPoolExecutor(max_workers=MAX_API_WORKERS)
+
+def submit_with_script_context(fn, *args):
+    """Run fn on the shared executor under this run's script context, so errors it reports reach the page"""
+    ctx = get_script_run_ctx()
+    
+    def run():
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fn(*args)
+    
+    return get_executor().submit(run)
+
+class GoogleApiError(Exception):
+    """Raised when a Google API answers with a non-OK status, so the failure is not cached"""
+
+@st.cache_data(ttl=86400, max_entries=1024, show_spinner=False)
+@disk_cached(expire=86400)
+def fetch_hospital_details(place_id, _api_key):
+    """Fetch place details from the Google Places API (cached per place_id)"""
+    url = f"https://maps.googleapis.com/maps/api/place/details/json?place_id={place_id}&fields=name,formatted_address,formatted_phone_number,website,rating,user_ratings_total,types&key={_api_key}"
+    response = get_http_session().get(url)
+    data = orjson.loads(response.content)
+    
+    if data["status"] != "OK":
+        raise GoogleApiError(data["status"])
+    
+    return data["result"]
+
 def get_hospital_details(place_id, api_key):
     """Get hospital details using place_id"""
-    url = f"https://maps.googleapis.com/maps/api/place/details/json?place_id={place_id}&fields=name,formatted_address,formatted_phone_number,website,rating,user_ratings_total,types&key={api_key}"
     try:
-        response = requests.get(url)
-        data = response.json()
-        
-        if data["status"] == "OK":
-            return data["result"]
+        return fetch_hospital_details(place_id, api_key)
+    except GoogleApiError:
+        pass
     except Exception as e:
         st.error(f"Error fetching hospital details: {e}")
     
     return None
 
+@st.cache_data(ttl=86400, max_entries=1024, show_spinner=False)
+@disk_cached(expire=7 * 86400)
+def fetch_geocode(address, _api_key):
+    """Geocode a normalized address with the Google Geocoding API (cached per address)"""
+    url = f"https://maps.googleapis.com/maps/api/geocode/json?address={urllib.parse.quote(address)}&key={_api_key}&region=in"
+    response = get_http_session().get(url)
+    data = orjson.loads(response.content)
+    
+    if data["status"] != "OK":
+        raise GoogleApiError(data["status"])
+    
+    location = data["results"][0]["geometry"]["location"]
+    formatted_address = data["results"][0]["formatted_address"]
+    return location["lat"], location["lng"], formatted_address
+
 def geocode_address(address, api_key):
     """Convert address to geographic coordinates using Google Geocoding API"""
-    url = f"https://maps.googleapis.com/maps/api/geocode/json?address={urllib.parse.quote(address)}&key={api_key}&region=in"
-    
     try:
-        response = requests.get(url)
-        data = response.json()
-        
-        if data["status"] == "OK":
-            location = data["results"][0]["geometry"]["location"]
-            formatted_address = data["results"][0]["formatted_address"]
-            return location["lat"], location["lng"], formatted_address
-        else:
-            st.error(f"Geocoding error: {data['status']}")
-            return None, None, None
+        return fetch_geocode(address.strip().lower(), api_key)
+    except GoogleApiError as e:
+        st.error(f"Geocoding error: {e}")
     except Exception as e:
         st.error(f"Error geocoding address: {e}")
-        return None, None, None
+    
+    return None, None, None
+
+PLACES_FIELD_MASK = ",".join([
+    "places.id",
+    "places.displayName",
+    "places.location",
+    "places.rating",
+    "places.userRatingCount",
+    "places.types",
+    "places.formattedAddress"
+])
+
+def normalize_place(place):
+    """Convert a Places API (New) place into the legacy nearby-search result shape used by the rest of the app"""
+    location = place.get("location", {})
+    hospital = {
+        "place_id": place.get("id"),
+        "geometry": {"location": {"lat": location.get("latitude"), "lng": location.get("longitude")}},
+        "types": place.get("types", [])
+    }
+    
+    # Only copy optional fields that are present, so downstream .get() defaults still apply
+    if "displayName" in place:
+        hospital["name"] = place["displayName"].get("text", "")
+    if "formattedAddress" in place:
+        hospital["vicinity"] = place["formattedAddress"]
+    if "rating" in place:
+        hospital["rating"] = place["rating"]
+    if "userRatingCount" in place:
+        hospital["user_ratings_total"] = place["userRatingCount"]
+    
+    return hospital
+
+@st.cache_data(ttl=86400, max_entries=1024, show_spinner=False)
+@disk_cached(expire=6 * 3600)
+def fetch_hospitals_nearby(lat, lng, radius_meters, included_types, rank_preference, _api_key):
+    """Fetch nearby places of the given types from the Places API (New), requesting only the fields
+    the app uses (cached per location and query)"""
+    url = "https://places.googleapis.com/v1/places:searchNearby"
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Goog-Api-Key': _api_key,
+        'X-Goog-FieldMask': PLACES_FIELD_MASK
+    }
+    
+    data = {
+        "includedTypes": list(included_types),
+        "maxResultCount": MAX_RESULTS,
+        "rankPreference": rank_preference,
+        "locationRestriction": {
+            "circle": {
+                "center": {"latitude": lat, "longitude": lng},
+                "radius": radius_meters
+            }
+        }
+    }
+    
+    response = get_http_session().post(url, headers=headers, data=orjson.dumps(data))
+    result = orjson.loads(response.content)
+    
+    if "error" in result:
+        raise GoogleApiError(result["error"].get("message", result["error"].get("status")))
+    
+    # An empty body means no places matched
+    return [normalize_place(place) for place in result.get("places", [])]
 
 def search_hospitals_google(lat, lng, api_key):
     """Search for hospitals using Google Places API"""
-    hospitals = []
-    page_token = None
+    hospitals = {}
     
-    # Make initial and follow-up requests with pagetoken if available
-    for _ in range(3):  # Limit to 3 pages of results (60 places maximum)
-        if page_token:
-            url = f"https://maps.googleapis.com/maps/api/place/nearbysearch/json?pagetoken={page_token}&key={api_key}"
-        else:
-            url = (
-                f"https://maps.googleapis.com/maps/api/place/nearbysearch/json?"
-                f"location={lat},{lng}&radius={RADIUS_METERS}&type=hospital&key={api_key}"
-            )
-        
+    # Searches are I/O-bound, so run the queries concurrently and merge them, dropping duplicates.
+    # Round to ~100 m so nearby searches share cached results.
+    futures = [
+        submit_with_script_context(
+            fetch_hospitals_nearby,
+            round(lat, 3), round(lng, 3), RADIUS_METERS, included_types, rank_preference, api_key
+        )
+        for included_types, rank_preference in NEARBY_SEARCH_QUERIES
+    ]
+    
+    for future in futures:
         try:
-            response = requests.get(url)
-            data = response.json()
-            
-            if data["status"] == "OK":
-                hospitals.extend(data["results"])
-                
-                if "next_page_token" in data:
-                    page_token = data["next_page_token"]
-                    # Need to wait a bit before using the page token
-                    time.sleep(2)
-                else:
-                    break
-            else:
-                st.warning(f"Google Places API error: {data.get('status')}")
-                break
+            for hospital in future.result():
+                hospitals.setdefault(hospital["place_id"], hospital)
+        except GoogleApiError as e:
+            st.warning(f"Google Places API error: {e}")
         except Exception as e:
             st.error(f"Error searching hospitals: {e}")
-            break
     
-    return hospitals
+    # Classify each hospital once here; everything downstream just reads the flags
+    for hospital in hospitals.values():
+        hospital["is_multispeciality"] = is_multispeciality_hospital(hospital)
+        hospital["has_emergency"] = has_ample_emergency_services(hospital)
+    
+    return list(hospitals.values())
+
+@st.cache_resource(show_spinner=False)
+def warm_sample_locations():
+    """Geocode the sample locations once per process so choosing one is instant"""
+    for location in SAMPLE_LOCATIONS:
+        try:
+            fetch_geocode(location.strip().lower(), API_KEY)
+        except Exception:
+            pass  # Any error is reported when the location is actually searched
 
 def is_multispeciality_hospital(hospital):
     """Check if a hospital is likely a multispeciality hospital based on its name and ratings"""
     # Check for keywords in the name
-    name = hospital.get('name', '').lower()
-    multispeciality_keywords = ['multi', 'general', 'district', 'medical center', 'medical college', 
-                              'aiims', 'government', 'state', 'university', 'memorial']
-    
-    for keyword in multispeciality_keywords:
-        if keyword in name:
-            return True
+    if MULTISPECIALITY_PATTERN.search(hospital.get('name', '')):
+        return True
     
     # Consider hospitals with high ratings and many reviews as likely multispeciality
     rating = hospital.get('rating', 0)
@@ -142,21 +330,12 @@ def is_multispeciality_hospital(hospital):
 def has_ample_emergency_services(hospital):
     """Check if a hospital likely has ample emergency services based on name and other attributes"""
     # Check for keywords in the name
-    name = hospital.get('name', '').lower()
-    emergency_keywords = ['emergency', 'trauma', 'accident', 'emergency care', '24 hour', '24/7',
-                         'critical care', 'casualty', 'emergency department']
-    
-    for keyword in emergency_keywords:
-        if keyword in name:
-            return True
+    if EMERGENCY_PATTERN.search(hospital.get('name', '')):
+        return True
     
     # Look for emergency-related types in the hospital data
-    types = hospital.get('types', [])
-    emergency_types = ['emergency_room', 'emergency_service', 'trauma_center']
-    
-    for type_name in emergency_types:
-        if type_name in types:
-            return True
+    if not EMERGENCY_TYPES.isdisjoint(hospital.get('types', [])):
+        return True
     
     # Larger, higher-rated hospitals are more likely to have ample emergency services
     rating = hospital.get('rating', 0)
@@ -168,12 +347,14 @@ def has_ample_emergency_services(hospital):
     
     return False
 
-def get_travel_time_with_traffic(origin_lat, origin_lng, dest_lat, dest_lng, api_key):
-    """Get travel time considering traffic using Google Maps Routes API"""
+@st.cache_data(ttl=300, max_entries=4096, show_spinner=False)
+@disk_cached(expire=300)
+def fetch_route(origin_lat, origin_lng, dest_lat, dest_lng, _api_key):
+    """Fetch a traffic-aware route from the Google Maps Routes API (cached for 5 minutes)"""
     url = "https://routes.googleapis.com/directions/v2:computeRoutes"
     headers = {
         'Content-Type': 'application/json',
-        'X-Goog-Api-Key': api_key,
+        'X-Goog-Api-Key': _api_key,
         'X-Goog-FieldMask': 'routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline'
     }
     
@@ -204,76 +385,225 @@ def get_travel_time_with_traffic(origin_lat, origin_lng, dest_lat, dest_lng, api
         }
     }
     
-    try:
-        response = requests.post(url, headers=headers, data=json.dumps(data))
-        result = response.json()
+    response = get_http_session().post(url, headers=headers, data=orjson.dumps(data))
+    result = orjson.loads(response.content)
+    
+    if "routes" in result and len(result["routes"]) > 0:
+        route = result["routes"][0]
+        duration_seconds = int(route.get("duration", "").replace("s", ""))
+        distance_meters = route.get("distanceMeters", 0)
+        polyline_str = route.get("polyline", {}).get("encodedPolyline", "")
         
-        if "routes" in result and len(result["routes"]) > 0:
-            route = result["routes"][0]
-            duration_seconds = int(route.get("duration", "").replace("s", ""))
-            distance_meters = route.get("distanceMeters", 0)
-            polyline_str = route.get("polyline", {}).get("encodedPolyline", "")
-            
-            return {
-                "duration_seconds": duration_seconds,
-                "distance_meters": distance_meters,
-                "polyline": polyline_str
-            }
+        return {
+            "duration_seconds": duration_seconds,
+            "distance_meters": distance_meters,
+            "polyline": polyline_str
+        }
+    
+    return None
+
+def get_travel_time_with_traffic(origin_lat, origin_lng, dest_lat, dest_lng, api_key):
+    """Get travel time considering traffic using Google Maps Routes API"""
+    try:
+        # Snap to a ~10 m grid so repeat searches from the same spot hit the cache
+        return fetch_route(
+            round(origin_lat, 4), round(origin_lng, 4), round(dest_lat, 4), round(dest_lng, 4), api_key
+        )
     except Exception as e:
         st.error(f"Error getting travel time: {e}")
     
     return None
 
-def get_speed_limits(path_points, api_key):
-    """Get speed limits using Google Roads API"""
-    # Convert path points to string format
-    path_string = "|".join([f"{lat},{lng}" for lat, lng in path_points])
+@st.cache_data(ttl=300, max_entries=4096, show_spinner=False)
+@disk_cached(expire=300)
+def fetch_travel_matrix(origin_lat, origin_lng, destinations, _api_key):
+    """Fetch travel times from one origin to a tuple of destinations with the Routes API route matrix
+    (cached for 5 minutes)"""
+    url = "https://routes.googleapis.com/distanceMatrix/v2:computeRouteMatrix"
+    headers = {
+        'Content-Type': 'application/json',
+        'X-Goog-Api-Key': _api_key,
+        'X-Goog-FieldMask': 'originIndex,destinationIndex,duration,distanceMeters,condition'
+    }
     
-    url = f"https://roads.googleapis.com/v1/speedLimits?path={path_string}&key={api_key}"
+    data = {
+        "origins": [
+            {"waypoint": {"location": {"latLng": {"latitude": origin_lat, "longitude": origin_lng}}}}
+        ],
+        "destinations": [
+            {"waypoint": {"location": {"latLng": {"latitude": lat, "longitude": lng}}}}
+            for lat, lng in destinations
+        ],
+        "travelMode": "DRIVE",
+        "routingPreference": "TRAFFIC_AWARE"
+    }
+    
+    response = get_http_session().post(url, headers=headers, data=orjson.dumps(data))
+    result = orjson.loads(response.content)
+    
+    if isinstance(result, dict):
+        raise GoogleApiError(result.get('error', {}).get('message', result))
+    
+    travel_infos = [None] * len(destinations)
+    for element in result:
+        if element.get("condition") == "ROUTE_EXISTS":
+            # Zero-valued indices are omitted from the response
+            travel_infos[element.get("destinationIndex", 0)] = {
+                "duration_seconds": int(element.get("duration", "0s").replace("s", "")),
+                "distance_meters": element.get("distanceMeters", 0)
+            }
     
+    return travel_infos
+
+def get_travel_matrix(origin_lat, origin_lng, destinations, api_key):
+    """Get traffic-aware travel times from one origin to many destinations in a single Routes API call.
+    Returns a list aligned with destinations, with None where no route was found."""
     try:
-        response = requests.get(url)
-        data = response.json()
-        
-        if "speedLimits" in data:
-            return data["speedLimits"]
+        # Snap to a ~10 m grid so repeat searches from the same spot hit the cache
+        return fetch_travel_matrix(
+            round(origin_lat, 4),
+            round(origin_lng, 4),
+            tuple((round(lat, 4), round(lng, 4)) for lat, lng in destinations),
+            api_key
+        )
     except Exception as e:
-        st.error(f"Error getting speed limits: {e}")
+        st.error(f"Error getting travel times: {e}")
     
-    return []
+    return [None] * len(destinations)
 
 def decode_polyline(encoded_polyline):
     """Decode Google's encoded polyline format"""
-    points = polyline.decode(encoded_polyline)
-    return [(point[0], point[1]) for point in points]
+    # Walk the raw bytes once instead of slicing and re-encoding the string per point
+    data = encoded_polyline.encode("ascii")
+    length = len(data)
+    points = []
+    index = lat = lng = 0
+    
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            result = shift = 0
+            while True:
+                byte = data[index] - 63
+                index += 1
+                result |= (byte & 0x1f) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lng += deltas[1]
+        points.append((lat / 1e5, lng / 1e5))
+    
+    return points
+
+def simplify_polyline(points, tolerance=ROUTE_SIMPLIFY_TOLERANCE):
+    """Simplify a list of (lat, lng) points with the Ramer-Douglas-Peucker algorithm"""
+    if len(points) < 3:
+        return points
+    
+    coords = np.asarray(points)
+    keep = np.zeros(len(coords), dtype=bool)
+    keep[0] = keep[-1] = True
+    
+    # Iterative RDP: split each span at its farthest point until every point is within tolerance
+    stack = [(0, len(coords) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        
+        segment = coords[end] - coords[start]
+        offsets = coords[start + 1:end] - coords[start]
+        segment_length = np.hypot(*segment)
+        if segment_length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / segment_length
+        
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    
+    return [tuple(point) for point in coords[keep].tolist()]
+
+def haversine_km(origin_lat, origin_lng, lats, lngs):
+    """Great-circle distances in km from one origin to arrays of coordinates"""
+    lat1, lng1 = np.radians(origin_lat), np.radians(origin_lng)
+    lat2, lng2 = np.radians(lats), np.radians(lngs)
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
 
-def find_hospitals_within_travel_time(origin_lat, origin_lng, hospitals, api_key, max_travel_time=MAX_TRAVEL_TIME_SECONDS):
+def find_hospitals_within_travel_time(origin_lat, origin_lng, hospitals, api_key, max_travel_time=MAX_TRAVEL_TIME_SECONDS,
+                                      search_radius_km=RADIUS_KM):
     """Find hospitals that are reachable within the specified travel time"""
     reachable_hospitals = []
     
+    # Only hospitals with coordinates can be routed to
+    candidates = []
+    for hospital in hospitals:
+        lat = hospital.get('geometry', {}).get('location', {}).get('lat')
+        lng = hospital.get('geometry', {}).get('location', {}).get('lng')
+        if lat and lng:
+            candidates.append((hospital, (lat, lng)))
+    
+    # Skip hospitals outside the search radius (with slack for roads) or too far away to reach in time
+    # even at top speed, so they never cost a Routes call
+    if candidates:
+        coords = np.array([location for _, location in candidates])
+        distances_km = haversine_km(origin_lat, origin_lng, coords[:, 0], coords[:, 1])
+        max_distance_km = min(max_travel_time * MAX_ROAD_SPEED_KMH / 3600, search_radius_km * SEARCH_RADIUS_SLACK)
+        candidates = [candidate for candidate, keep in zip(candidates, distances_km <= max_distance_km) if keep]
+    
+    # One route-matrix call covers a whole batch of hospitals
+    batches = [candidates[i:i + MATRIX_MAX_DESTINATIONS] for i in range(0, len(candidates), MATRIX_MAX_DESTINATIONS)]
+    
     with st.spinner("Calculating travel times to hospitals..."):
-        # Calculate travel time for each hospital
-        for hospital in hospitals:
-            try:
-                lat = hospital.get('geometry', {}).get('location', {}).get('lat')
-                lng = hospital.get('geometry', {}).get('location', {}).get('lng')
-                
-                if lat and lng:
-                    travel_info = get_travel_time_with_traffic(origin_lat, origin_lng, lat, lng, api_key)
-                    
+        # Batches are I/O-bound, so issue them concurrently on the shared executor
+        futures = {
+            submit_with_script_context(
+                get_travel_matrix, origin_lat, origin_lng, [location for _, location in batch], api_key
+            ): batch
+            for batch in batches
+        }
+        
+        for future in as_completed(futures):
+            batch = futures[future]
+            for (hospital, _), travel_info in zip(batch, future.result()):
+                try:
                     if travel_info and travel_info["duration_seconds"] <= max_travel_time:
                         # Add travel information to the hospital data
                         hospital["travel_info"] = travel_info
-                        hospital["is_multispeciality"] = is_multispeciality_hospital(hospital)
-                        hospital["has_emergency"] = has_ample_emergency_services(hospital)
                         reachable_hospitals.append(hospital)
-            except Exception as e:
-                st.error(f"Error processing hospital {hospital.get('name', 'Unknown')}: {e}")
+                except Exception as e:
+                    st.error(f"Error processing hospital {hospital.get('name', 'Unknown')}: {e}")
     
-    # Sort by travel time
-    reachable_hospitals.sort(key=lambda x: x.get("travel_info", {}).get("duration_seconds", float('inf')))
+    return sort_hospitals_by_category(reachable_hospitals)
+
+def sort_hospitals_by_category(hospitals):
+    """Stamp each hospital with its display category (0 emergency, 1 multispeciality, 2 other)
+    and sort by category, then travel time"""
+    if not hospitals:
+        return []
+    
+    df = pd.DataFrame({
+        "has_emergency": [h.get('has_emergency', False) for h in hospitals],
+        "is_multispeciality": [h.get('is_multispeciality', False) for h in hospitals],
+        "duration_seconds": [h.get('travel_info', {}).get('duration_seconds', float('inf')) for h in hospitals]
+    })
+    df["category"] = np.where(df.has_emergency, 0, np.where(df.is_multispeciality, 1, 2))
+    df = df.sort_values(["category", "duration_seconds"], kind="stable")
+    
+    sorted_hospitals = []
+    for index, category in zip(df.index, df.category):
+        hospital = hospitals[index]
+        hospital["category"] = int(category)
+        sorted_hospitals.append(hospital)
     
-    return reachable_hospitals
+    return sorted_hospitals
 
 def format_travel_time(seconds):
     """Format seconds into a readable travel time string"""
@@ -292,7 +622,7 @@ def format_travel_time(seconds):
 def create_route_map(center_lat, center_lng, selected_hospital, radius_km=RADIUS_KM):
     """Create a folium map with the route to the selected hospital"""
     # Create base map centered on selected location
-    m = folium.Map(location=[center_lat, center_lng], zoom_start=12)
+    m = folium.Map(location=[center_lat, center_lng], zoom_start=12, prefer_canvas=True)
     
     # Add a marker for the selected location
     folium.Marker(
@@ -346,7 +676,8 @@ def create_route_map(center_lat, center_lng, selected_hospital, radius_km=RADIUS
     # Add the route polyline if available
     if "polyline" in travel_info:
         encoded_polyline = travel_info["polyline"]
-        points = decode_polyline(encoded_polyline)
+        # Long routes decode to thousands of points; simplify so the embedded map HTML stays small
+        points = simplify_polyline(decode_polyline(encoded_polyline))
         
         folium.PolyLine(
             points,
@@ -358,10 +689,22 @@ def create_route_map(center_lat, center_lng, selected_hospital, radius_km=RADIUS
     
     return m
 
+# Builds one hospital marker from a [lat, lng, color, icon, popup_html, name] row in the browser,
+# matching the folium.Marker styling used for small result sets
+FAST_MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: row[3], markerColor: row[2], prefix: 'fa', iconColor: 'white'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[4], {maxWidth: 300});
+    marker.bindTooltip(row[5]);
+    return marker;
+}
+"""
+
 def create_hospitals_map(center_lat, center_lng, hospitals, radius_km=RADIUS_KM):
     """Create a folium map with hospital markers and radius circle"""
     # Create base map centered on selected location
-    m = folium.Map(location=[center_lat, center_lng], zoom_start=12)
+    m = folium.Map(location=[center_lat, center_lng], zoom_start=12, prefer_canvas=True)
     
     # Add a circle representing the search radius
     folium.Circle(
@@ -380,10 +723,17 @@ def create_hospitals_map(center_lat, center_lng, hospitals, radius_km=RADIUS_KM)
         icon=folium.Icon(color='red', icon='home', prefix='fa')
     ).add_to(m)
     
-    # Create a marker cluster for hospitals
-    marker_cluster = MarkerCluster().add_to(m)
+    # Cheap bounding-box cull so hospitals far outside the search radius never get markers built
+    half_height = radius_km * SEARCH_RADIUS_SLACK / KM_PER_DEGREE_LAT
+    half_width = half_height / max(np.cos(np.radians(center_lat)), 1e-6)
+    hospitals = [
+        hospital for hospital in hospitals
+        if abs(hospital.get('geometry', {}).get('location', {}).get('lat', center_lat) - center_lat) <= half_height
+        and abs(hospital.get('geometry', {}).get('location', {}).get('lng', center_lng) - center_lng) <= half_width
+    ]
     
-    # Add hospital markers
+    # Collect marker data for each hospital
+    markers = []
     for hospital in hospitals:
         try:
             lat = hospital.get('geometry', {}).get('location', {}).get('lat')
@@ -428,17 +778,143 @@ def create_hospitals_map(center_lat, center_lng, hospitals, radius_km=RADIUS_KM)
                 </div>
                 """
                 
-                folium.Marker(
-                    location=[lat, lng],
-                    popup=folium.Popup(popup_html, max_width=300),
-                    tooltip=name,
-                    icon=folium.Icon(color=color, icon=icon_name, prefix='fa')
-                ).add_to(marker_cluster)
+                markers.append([lat, lng, color, icon_name, popup_html, name])
         except Exception as e:
             st.error(f"Error adding marker: {e}")
     
+    if len(markers) > FAST_CLUSTER_THRESHOLD:
+        # Ship the markers as one data array and let the browser build them in bulk
+        FastMarkerCluster(markers, callback=FAST_MARKER_CALLBACK).add_to(m)
+    elif markers:
+        # One GeoJSON layer of canvas-drawn circles instead of a templated marker per hospital
+        hospitals_geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [lng, lat]},
+                    "properties": {"name": name, "color": color, "popup": popup_html}
+                }
+                for lat, lng, color, icon_name, popup_html, name in markers
+            ]
+        }
+        
+        folium.GeoJson(
+            hospitals_geojson,
+            name="Hospitals",
+            marker=folium.CircleMarker(radius=8, fill=True, fill_opacity=0.85, weight=2),
+            style_function=lambda feature: {
+                "color": feature["properties"]["color"],
+                "fillColor": feature["properties"]["color"]
+            },
+            tooltip=folium.GeoJsonTooltip(fields=["name"], labels=False),
+            popup=folium.GeoJsonPopup(fields=["popup"], labels=False)
+        ).add_to(m)
+    
+    return m
+
+def create_blind_spot_map(center_lat, center_lng, radius_km=RADIUS_KM):
+    """Create a folium map marking a location with no hospital reachable in time"""
+    # Create a simple map showing the user's location
+    m = folium.Map(location=[center_lat, center_lng], zoom_start=12, prefer_canvas=True)
+    
+    # Add a marker for the user's location
+    folium.Marker(
+        location=[center_lat, center_lng],
+        popup="Your Location",
+        tooltip="Your Location",
+        icon=folium.Icon(color='red', icon='home', prefix='fa')
+    ).add_to(m)
+    
+    # Add a circle representing the search radius
+    folium.Circle(
+        location=[center_lat, center_lng],
+        radius=radius_km * 1000,  # Convert km to meters
+        color='red',
+        fill=True,
+        fill_opacity=0.2
+    ).add_to(m)
+    
+    return m
+
+def create_location_map(center_lat, center_lng):
+    """Create a simple folium map marking the user's location"""
+    m = folium.Map(location=[center_lat, center_lng], zoom_start=13, prefer_canvas=True)
+    
+    # Add a marker for the user's location
+    folium.Marker(
+        location=[center_lat, center_lng],
+        popup="Your Location",
+        tooltip="Your Location",
+        icon=folium.Icon(color='red', icon='home', prefix='fa')
+    ).add_to(m)
+    
     return m
 
+def map_to_html(m):
+    """Render a folium map to a standalone HTML document"""
+    return folium.Figure().add_child(m).render()
+
+def show_map_html(html, width=800, height=500):
+    """Display pre-rendered map HTML at the size used for the other maps"""
+    components.html(html, width=width, height=height + 10)
+
+def hospitals_key(hospitals):
+    """Small hashable fingerprint of a hospital list, used as a map cache key"""
+    return tuple(
+        (
+            hospital.get('place_id'),
+            hospital.get('travel_info', {}).get('duration_seconds'),
+            hospital.get('category')
+        )
+        for hospital in hospitals
+    )
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_hospitals_map_html(center_lat, center_lng, key, radius_km, _hospitals):
+    """Build the hospitals map HTML once per search result; key identifies _hospitals"""
+    return map_to_html(create_hospitals_map(center_lat, center_lng, _hospitals, radius_km))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_route_map_html(center_lat, center_lng, key, _selected_hospital):
+    """Build the route map HTML once per selected hospital and route; key identifies _selected_hospital"""
+    return map_to_html(create_route_map(center_lat, center_lng, _selected_hospital))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_blind_spot_map_html(center_lat, center_lng, radius_km):
+    """Build the blind-spot map HTML once per location and radius"""
+    return map_to_html(create_blind_spot_map(center_lat, center_lng, radius_km))
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def render_location_map_html(center_lat, center_lng):
+    """Build the initial location map HTML once per location"""
+    return map_to_html(create_location_map(center_lat, center_lng))
+
+@st.cache_data(show_spinner=False)
+def render_default_map_html():
+    """Build the default map of India once"""
+    return map_to_html(folium.Map(location=[20.5937, 78.9629], zoom_start=5, prefer_canvas=True))  # Centered on India
+
+def hospital_label(index):
+    """Radio label for the reachable hospital at index"""
+    hospital = st.session_state.reachable_hospitals[index]
+    icon = HOSPITAL_CATEGORY_ICONS[hospital.get('category', 2)]
+    name = hospital.get('name', 'Unknown Hospital')
+    travel_time = format_travel_time(hospital.get('travel_info', {}).get('duration_seconds', 0))
+    return f"{icon} {name} - {travel_time}"
+
+def select_hospital():
+    """Show the route to the hospital picked in the list"""
+    choice = st.session_state.hospital_choice
+    st.session_state.selected_hospital = None if choice is None else st.session_state.reachable_hospitals[choice]
+
+def clear_selected_hospital():
+    """Return from the route view to the hospital list"""
+    st.session_state.selected_hospital = None
+    st.session_state.hospital_choice = None
+
+warm_sample_locations()
+
 # Sidebar for configuration
 with st.sidebar:
     st.header("Configuration")
@@ -446,9 +922,8 @@ with st.sidebar:
     # API key information
     st.info(
         "This application requires Google API keys with access to:"
-        "\n- Google Places API"
+        "\n- Google Places API and Places API (New)"
         "\n- Google Maps Routes API"
-        "\n- Google Roads API"
         "\n- Google Geocoding API"
     )
     
@@ -456,14 +931,7 @@ with st.sidebar:
     st.subheader("Sample Locations")
     sample_location = st.selectbox(
         "Select a sample location",
-        [
-            "Custom Input",
-            "Gurgaon, Haryana",
-            "Ahmedabad, Gujarat",
-            "Vijayawada, Andhra Pradesh",
-            "Siliguri, West Bengal",
-            "Kochi, Kerala"
-        ]
+        ["Custom Input"] + SAMPLE_LOCATIONS
     )
     
     if sample_location != "Custom Input":
@@ -508,6 +976,8 @@ with col1:
         st.session_state.hospitals = []
     if 'reachable_hospitals' not in st.session_state:
         st.session_state.reachable_hospitals = []
+    if 'search_radius_km' not in st.session_state:
+        st.session_state.search_radius_km = RADIUS_KM
     if 'selected_hospital' not in st.session_state:
         st.session_state.selected_hospital = None
     
@@ -581,15 +1051,18 @@ with col1:
                     st.session_state.lng,
                     google_hospitals,
                     API_KEY,
-                    max_travel_seconds
+                    max_travel_seconds,
+                    search_radius
                 )
                 
                 # Store hospital data in session state
                 st.session_state.hospitals = google_hospitals
                 st.session_state.reachable_hospitals = reachable_hospitals
+                # The map culls markers by the radius the search used, not the current slider value
+                st.session_state.search_radius_km = search_radius
                 
                 # Clear selected hospital
-                st.session_state.selected_hospital = None
+                clear_selected_hospital()
                 
                 # Show success message or warning
                 if reachable_hospitals:
@@ -601,46 +1074,17 @@ with col1:
     if st.session_state.reachable_hospitals:
         st.header("Hospitals Within Travel Time")
         
-        # Group hospitals by type
-        emergency_hospitals = [h for h in st.session_state.reachable_hospitals if h.get('has_emergency', False)]
-        multispeciality = [h for h in st.session_state.reachable_hospitals if h.get('is_multispeciality', False) and not h.get('has_emergency', False)]
-        regular = [h for h in st.session_state.reachable_hospitals if not h.get('is_multispeciality', False) and not h.get('has_emergency', False)]
-        
-        # Display emergency hospitals first
-        if emergency_hospitals:
-            st.subheader("Hospitals with Emergency Services 🚑")
-            for i, hospital in enumerate(emergency_hospitals):
-                name = hospital.get('name', 'Unknown Hospital')
-                travel_time = format_travel_time(hospital.get('travel_info', {}).get('duration_seconds', 0))
-                
-                # Add emergency indicator
-                display_name = f"{name} - {travel_time}"
-                
-                if st.button(display_name, key=f"emerg_{i}"):
-                    st.session_state.selected_hospital = hospital
-                    st.success(f"Selected: {name}")
-        
-        # Display multispeciality hospitals next
-        if multispeciality:
-            st.subheader("Multispeciality Hospitals")
-            for i, hospital in enumerate(multispeciality):
-                name = hospital.get('name', 'Unknown Hospital')
-                travel_time = format_travel_time(hospital.get('travel_info', {}).get('duration_seconds', 0))
-                
-                if st.button(f"{name} - {travel_time}", key=f"multi_{i}"):
-                    st.session_state.selected_hospital = hospital
-                    st.success(f"Selected: {name}")
+        st.caption("🚑 Emergency services · 📋 Multispeciality · 🏥 Other hospitals")
         
-        # Display other hospitals
-        if regular:
-            st.subheader("Other Hospitals")
-            for i, hospital in enumerate(regular):
-                name = hospital.get('name', 'Unknown Hospital')
-                travel_time = format_travel_time(hospital.get('travel_info', {}).get('duration_seconds', 0))
-                
-                if st.button(f"{name} - {travel_time}", key=f"reg_{i}"):
-                    st.session_state.selected_hospital = hospital
-                    st.success(f"Selected: {name}")
+        # One radio for the whole list; hospitals arrive sorted by category, then travel time
+        st.radio(
+            "Select a hospital to see the route",
+            range(len(st.session_state.reachable_hospitals)),
+            index=None,
+            format_func=hospital_label,
+            key="hospital_choice",
+            on_change=select_hospital
+        )
     
     # Display a "No hospitals found" message if appropriate
     elif st.session_state.hospitals and not st.session_state.reachable_hospitals:
@@ -657,8 +1101,22 @@ with col2:
             selected_name = st.session_state.selected_hospital.get('name', 'Unknown Hospital')
             st.subheader(f"Route to {selected_name}")
             
+            # Travel times come from the route matrix; fetch only the route geometry for the selected hospital
+            travel_info = st.session_state.selected_hospital.setdefault('travel_info', {})
+            if "polyline" not in travel_info:
+                location = st.session_state.selected_hospital.get('geometry', {}).get('location', {})
+                with st.spinner("Calculating route..."):
+                    route = get_travel_time_with_traffic(
+                        st.session_state.lat,
+                        st.session_state.lng,
+                        location.get('lat'),
+                        location.get('lng'),
+                        API_KEY
+                    )
+                if route:
+                    travel_info['polyline'] = route['polyline']
+            
             # Display travel information
-            travel_info = st.session_state.selected_hospital.get('travel_info', {})
             travel_time = format_travel_time(travel_info.get('duration_seconds', 0))
             distance_km = travel_info.get('distance_meters', 0) / 1000
             
@@ -669,14 +1127,15 @@ with col2:
             with info_col2:
                 st.metric("Distance", f"{distance_km:.2f} km")
             
-            # Create and display route map
-            route_map = create_route_map(
+            # Create and display route map, reusing the rendered HTML on reruns
+            route_map_html = render_route_map_html(
                 st.session_state.lat,
                 st.session_state.lng,
+                hospitals_key([st.session_state.selected_hospital]) + (travel_info.get('polyline'),),
                 st.session_state.selected_hospital
             )
             
-            folium_static(route_map, width=800, height=500)
+            show_map_html(route_map_html)
             
             # Hospital details
             st.subheader("Hospital Details")
@@ -686,17 +1145,22 @@ with col2:
                     details = get_hospital_details(place_id, API_KEY)
                     
                     if details:
-                        st.markdown(f"**Name:** {details.get('name', 'N/A')}")
-                        st.markdown(f"**Address:** {details.get('formatted_address', 'N/A')}")
+                        detail_lines = [
+                            f"**Name:** {details.get('name', 'N/A')}",
+                            f"**Address:** {details.get('formatted_address', 'N/A')}"
+                        ]
                         
                         if 'formatted_phone_number' in details:
-                            st.markdown(f"**Phone:** {details.get('formatted_phone_number')}")
+                            detail_lines.append(f"**Phone:** {details.get('formatted_phone_number')}")
                         
                         if 'website' in details:
-                            st.markdown(f"**Website:** [{details.get('website')}]({details.get('website')})")
+                            detail_lines.append(f"**Website:** [{details.get('website')}]({details.get('website')})")
                         
                         if 'rating' in details:
-                            st.markdown(f"**Rating:** {details.get('rating')}/5 ({details.get('user_ratings_total', 0)} reviews)")
+                            detail_lines.append(f"**Rating:** {details.get('rating')}/5 ({details.get('user_ratings_total', 0)} reviews)")
+                        
+                        # One markdown element instead of one per line
+                        st.markdown("\n\n".join(detail_lines))
                         
                         # Check if it's likely a multispeciality hospital
                         if st.session_state.selected_hospital.get('is_multispeciality', False):
@@ -709,9 +1173,7 @@ with col2:
                         st.warning("Could not fetch detailed information for this hospital.")
             
             # Add a button to go back to the hospital list view
-            if st.button("Back to Hospital List"):
-                st.session_state.selected_hospital = None
-                st.rerun()
+            st.button("Back to Hospital List", on_click=clear_selected_hospital)
             
         elif st.session_state.reachable_hospitals:
             # Show all reachable hospitals on the map
@@ -731,22 +1193,25 @@ with col2:
             with sum_col3:
                 st.metric("With Emergency Services", emergency_count)
             
-            # Create and display the map
-            hospitals_map = create_hospitals_map(
+            # Create and display the map, reusing the rendered HTML on reruns
+            hospitals_map_html = render_hospitals_map_html(
                 st.session_state.lat,
                 st.session_state.lng,
-                st.session_state.reachable_hospitals,
-                search_radius
+                hospitals_key(st.session_state.reachable_hospitals),
+                st.session_state.search_radius_km,
+                st.session_state.reachable_hospitals
             )
             
-            folium_static(hospitals_map, width=800, height=500)
+            show_map_html(hospitals_map_html)
             
             # Legend for map markers
-            st.markdown("**Map Legend:**")
-            st.markdown("🔵 Blue markers: Multispeciality hospitals")
-            st.markdown("🟢 Green markers: Regular hospitals")
-            st.markdown("🔴 Red markers: Hospitals with ample emergency services")
-            st.markdown("🏠 Red home icon: Your location")
+            st.markdown(
+                "**Map Legend:**\n\n"
+                "🔵 Blue markers: Multispeciality hospitals\n\n"
+                "🟢 Green markers: Regular hospitals\n\n"
+                "🔴 Red markers: Hospitals with ample emergency services\n\n"
+                "🏠 Red home icon: Your location"
+            )
             
             st.info("Click on a hospital in the list (left panel) to see the detailed route.")
             
@@ -754,57 +1219,29 @@ with col2:
             # No hospitals within travel time - blind spot
             st.warning(f"⚠️ **Blind Spot Detected**: No hospitals are reachable within {max_travel_minutes} minutes travel time from your location.")
             
-            # Create a simple map showing the user's location
-            m = folium.Map(location=[st.session_state.lat, st.session_state.lng], zoom_start=12)
-            
-            # Add a marker for the user's location
-            folium.Marker(
-                location=[st.session_state.lat, st.session_state.lng],
-                popup="Your Location",
-                tooltip="Your Location",
-                icon=folium.Icon(color='red', icon='home', prefix='fa')
-            ).add_to(m)
-            
-            # Add a circle representing the search radius
-            folium.Circle(
-                location=[st.session_state.lat, st.session_state.lng],
-                radius=search_radius * 1000,  # Convert km to meters
-                color='red',
-                fill=True,
-                fill_opacity=0.2
-            ).add_to(m)
-            
-            folium_static(m, width=800, height=500)
+            # Show the user's location and the search radius, reusing the rendered HTML on reruns
+            show_map_html(render_blind_spot_map_html(st.session_state.lat, st.session_state.lng, search_radius))
             
             st.error("You are in a medical 'blind spot'. No hospitals can be reached within the specified travel time.")
-            st.markdown("**Suggestions:**")
-            st.markdown("1. Increase the maximum travel time in the sidebar")
-            st.markdown("2. Try a different location")
-            st.markdown("3. Contact emergency services if this is an emergency")
+            st.markdown(
+                "**Suggestions:**\n"
+                "1. Increase the maximum travel time in the sidebar\n"
+                "2. Try a different location\n"
+                "3. Contact emergency services if this is an emergency"
+            )
             
         else:
             # Initial map view centered on user's location
             st.info("Use the controls on the left to search for hospitals near your location.")
             
-            # Create a simple initial map
-            initial_map = folium.Map(location=[st.session_state.lat, st.session_state.lng], zoom_start=13)
-            
-            # Add a marker for the user's location
-            folium.Marker(
-                location=[st.session_state.lat, st.session_state.lng],
-                popup="Your Location",
-                tooltip="Your Location",
-                icon=folium.Icon(color='red', icon='home', prefix='fa')
-            ).add_to(initial_map)
-            
-            folium_static(initial_map, width=800, height=500)
+            # Show the user's location, reusing the rendered HTML on reruns
+            show_map_html(render_location_map_html(st.session_state.lat, st.session_state.lng))
     else:
         # No location selected yet
         st.info("Please select a location using the controls on the left to start.")
         
         # Display a default map of India
-        default_map = folium.Map(location=[20.5937, 78.9629], zoom_start=5)  # Centered on India
-        folium_static(default_map, width=800, height=500)
+        show_map_html(render_default_map_html())
 
 # Footer with documentation
 st.markdown("---")
@@ -827,7 +1264,7 @@ with st.expander("Documentation and Help"):
     
     ### Notes
     
-    - This application requires Google API keys with access to Places, Maps Routes, Roads, and Geocoding APIs
+    - This application requires Google API keys with access to Places (legacy and New), Maps Routes, and Geocoding APIs
     - Hospital data is retrieved from Google Places API
     - Travel times are estimates and may vary based on actual traffic conditions
     """)
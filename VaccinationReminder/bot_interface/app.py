@@ -2,67 +2,30 @@ import streamlit as st
 import google.generativeai as genai
 from PIL import Image
 import io
-import json
 import time
 from dotenv import load_dotenv
 import os
-import random
+import re
+import orjson
+import hashlib
+import diskcache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # Load environment variables
 load_dotenv()
 
-# Configure Gemini API
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
-text_model = genai.GenerativeModel('gemini-1.5-pro-latest')
-vision_model = genai.GenerativeModel('gemini-1.5-pro-latest')
+# Gemini model used for both card reading and chat
+GEMINI_MODEL = 'gemini-1.5-pro-latest'
 
-# Configure the app
-st.set_page_config(
-    page_title="Vaccination Assistance Chatbot",
-    page_icon="💉",
-    layout="wide"
-)
-
-# Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-if "vaccination_data" not in st.session_state:
-    st.session_state.vaccination_data = None
-if "vaccination_card_processed" not in st.session_state:
-    st.session_state.vaccination_card_processed = False
-if "last_uploaded_file" not in st.session_state:
-    st.session_state.last_uploaded_file = None
-if "api_retry_count" not in st.session_state:
-    st.session_state.api_retry_count = 0
-
-def safe_generate_content(model, prompt_content, max_retries=3, initial_delay=1):
-    """Wrapper for generate_content with retry logic and error handling"""
-    retry_count = 0
-    delay = initial_delay
-    
-    while retry_count < max_retries:
-        try:
-            response = model.generate_content(
-                prompt_content,
-                generation_config={"temperature": 0.3}  # Slightly more creative but still factual
-            )
-            return response
-        except Exception as e:
-            if "429" in str(e):
-                retry_count += 1
-                st.session_state.api_retry_count += 1
-                wait_time = delay * (2 ** (retry_count - 1)) + random.uniform(0, 1)
-                st.warning(f"API rate limit reached. Retry {retry_count}/{max_retries} in {wait_time:.1f} seconds...")
-                time.sleep(wait_time)
-                delay *= 2  # Exponential backoff
-            else:
-                raise e
-    
-    raise Exception(f"API request failed after {max_retries} retries")
+# Gemini results persisted on disk, so re-uploading the same card skips the API even after a restart
+DISK_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".gemini_cache")
+EXTRACTION_CACHE_EXPIRE = 30 * 86400  # 30 days
+CARD_IMAGE_MAX_SIZE = (1024, 1024)  # Cards stay legible at this size, and smaller images are faster to display and send
+CARD_IMAGE_JPEG_QUALITY = 85
+MAX_CHAT_MESSAGES = 50  # Older messages are dropped so long-lived sessions don't keep growing
 
-def extract_vaccination_data(image_bytes):
-    """Extract vaccination details from card image with error handling"""
-    prompt = """
+# Prompt for reading a vaccination card; its hash is part of the cache key, so editing it invalidates old results
+EXTRACTION_PROMPT = """
     You are a medical document specialist analyzing a vaccination card. Extract ALL details including:
     1. PATIENT INFORMATION:
        - Full name (exact spelling)
@@ -99,63 +62,201 @@ def extract_vaccination_data(image_bytes):
         ]
     }
     """
+EXTRACTION_PROMPT_HASH = hashlib.sha256(EXTRACTION_PROMPT.encode()).hexdigest()[:16]
+
+# Prompt for the precautions of every due vaccine at once; results are cached per vaccine name and prompt hash
+PRECAUTIONS_PROMPT = """
+        Provide exactly 2-3 important precautions for someone about to receive each of these vaccines:
+        {vaccine_names}
+        Return JSON only, with one key per vaccine name exactly as given:
+        {{
+            "<vaccine name>": ["precaution", "precaution"]
+        }}
+        """
+PRECAUTIONS_PROMPT_HASH = hashlib.sha256(PRECAUTIONS_PROMPT.encode()).hexdigest()[:16]
+PRECAUTIONS_CACHE_EXPIRE = 30 * 86400  # 30 days
+
+# Precautions shown when Gemini is unavailable
+FALLBACK_PRECAUTIONS = {
+    "COVID-19": [
+        "Monitor for allergic reactions for 15-30 minutes after vaccination",
+        "Inform your doctor about any history of blood clotting disorders",
+        "Stay hydrated and rest after vaccination"
+    ],
+    "Flu": [
+        "Inform your doctor if you have egg allergies",
+        "Avoid vaccination if you currently have a fever",
+        "Mild flu-like symptoms are common for 1-2 days after vaccination"
+    ],
+    "default": [
+        "Consult your doctor before vaccination",
+        "Inform about any allergies or medical conditions",
+        "Stay at the clinic for observation for 15-30 minutes after vaccination"
+    ]
+}
+
+# System prompt for generic vaccination questions
+CHAT_SYSTEM_PROMPT = """
+    You are a Vaccination Expert Assistant with the following capabilities:
+    
+    1. For GENERAL vaccination questions (without personal data):
+    - Provide accurate, up-to-date information about vaccines
+    - Explain vaccine schedules, side effects, precautions
+    - Offer travel vaccination advice
+    - Compare different vaccine brands
+    - Explain vaccine efficacy and duration
+    
+    2. For PERSONALIZED questions (when vaccination card is uploaded):
+    - Answer based on the user's specific vaccination history
+    - Identify missing vaccines based on age/health conditions
+    - Calculate due dates for next doses
+    - Provide personalized precautions
+    
+    3. Response Guidelines:
+    - Be concise but thorough (3-5 sentences for most answers)
+    - Use bullet points for lists of side effects/precautions
+    - Always cite reputable sources when possible
+    - If unsure, recommend consulting a healthcare provider
+    - For age/condition specific advice, ask for clarification if needed
+    """
+
+# JSON object or array inside a Markdown code fence, as Gemini often wraps its answers
+JSON_FENCE_PATTERN = re.compile(r'```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```', re.S)
+
+# Configure the app
+st.set_page_config(
+    page_title="Vaccination Assistance Chatbot",
+    page_icon="💉",
+    layout="wide"
+)
+
+# Initialize session state
+if "messages" not in st.session_state:
+    st.session_state.messages = []
+if "vaccination_data" not in st.session_state:
+    st.session_state.vaccination_data = None
+if "vaccination_card_processed" not in st.session_state:
+    st.session_state.vaccination_card_processed = False
+if "last_uploaded_file" not in st.session_state:
+    st.session_state.last_uploaded_file = None
+if "api_retry_count" not in st.session_state:
+    st.session_state.api_retry_count = 0
+
+@st.cache_resource
+def get_gemini_model():
+    """Configure the Gemini API and build the model once per process, shared by all sessions"""
+    genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+    return genai.GenerativeModel(GEMINI_MODEL)
+
+@st.cache_resource
+def get_disk_cache():
+    """Disk cache shared by all sessions, opened once per process"""
+    return diskcache.Cache(DISK_CACHE_DIR)
+
+def parse_json_response(response_text):
+    """Parse a model reply as JSON, unwrapping it from a code fence if present"""
+    match = JSON_FENCE_PATTERN.search(response_text)
+    return orjson.loads(match.group(1) if match else response_text)
+
+def is_rate_limit_error(exception):
+    """Only rate-limit errors are worth retrying"""
+    return "429" in str(exception)
+
+def count_retry(retry_state):
+    """Count retries so the sidebar can mention them once processing finishes"""
+    st.session_state.api_retry_count += 1
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(max=16),  # Starts at 1 s and doubles, plus up to 1 s of jitter
+    retry=retry_if_exception(is_rate_limit_error),
+    before_sleep=count_retry,
+    reraise=True
+)
+def safe_generate_content(model, prompt_content, stream=False):
+    """Wrapper for generate_content that retries rate-limited (429) requests with exponential backoff"""
+    return model.generate_content(
+        prompt_content,
+        generation_config={"temperature": 0.3},  # Slightly more creative but still factual
+        stream=stream
+    )
+
+def load_card_image(file_bytes):
+    """Decode and downscale the card image once per upload, keeping it in session state across reruns"""
+    image_key = hashlib.sha256(file_bytes).hexdigest()
+    if st.session_state.get("img_key") != image_key:
+        image = Image.open(io.BytesIO(file_bytes))
+        image.thumbnail(CARD_IMAGE_MAX_SIZE, Image.LANCZOS)
+        
+        # Re-encode as JPEG so the vision request uploads a compact image whatever the original format
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, "JPEG", quality=CARD_IMAGE_JPEG_QUALITY, optimize=True)
+        buffer.seek(0)
+        image = Image.open(buffer)
+        
+        st.session_state.img_key = image_key
+        st.session_state.img_thumb = image
+    
+    return st.session_state.img_thumb
+
+def extract_vaccination_data(image_key, image):
+    """Extract vaccination details from card image with error handling"""
+    # Identical image bytes always yield the same extraction, so key the cache on their hash
+    cache_key = ("vaccination_data", image_key, EXTRACTION_PROMPT_HASH)
+    cached = get_disk_cache().get(cache_key)
+    if cached is not None:
+        return cached
     
     try:
-        image = Image.open(io.BytesIO(image_bytes))
         response = safe_generate_content(
-            vision_model,
-            [prompt, image]
+            get_gemini_model(),
+            [EXTRACTION_PROMPT, image]
         )
         
-        # Clean response to extract JSON
-        response_text = response.text
-        if '```json' in response_text:
-            response_text = response_text.split('```json')[1].split('```')[0]
-        elif '```' in response_text:
-            response_text = response_text.split('```')[1]
-        
-        return json.loads(response_text)
+        vaccine_data = parse_json_response(response.text)
+        get_disk_cache().set(cache_key, vaccine_data, expire=EXTRACTION_CACHE_EXPIRE)
+        return vaccine_data
     except Exception as e:
         st.error(f"Error processing card: {str(e)}")
         return None
 
-def get_vaccine_precautions(vaccine_name):
-    """Get 2-3 precautions for a specific vaccine with fallback"""
+def precautions_cache_key(vaccine_name):
+    """Disk-cache key for one vaccine's precautions"""
+    return ("precautions", vaccine_name.strip().lower(), PRECAUTIONS_PROMPT_HASH)
+
+def get_vaccine_precautions(vaccine_names):
+    """Get 2-3 precautions for each vaccine in one Gemini request, with cache and fallback"""
+    precautions = {}
+    missing = []
+    for vaccine_name in vaccine_names:
+        cached = get_disk_cache().get(precautions_cache_key(vaccine_name))
+        if cached is not None:
+            precautions[vaccine_name] = cached
+        elif vaccine_name not in missing:
+            missing.append(vaccine_name)
+    
+    if not missing:
+        return precautions
+    
     try:
-        prompt = f"""
-        Provide exactly 2-3 important precautions for someone about to receive a {vaccine_name} vaccine.
-        Return as a JSON array only:
-        {{
-            "precautions": []
-        }}
-        """
+        prompt = PRECAUTIONS_PROMPT.format(vaccine_names=orjson.dumps(missing).decode())
         
-        response = safe_generate_content(text_model, prompt)
-        response_text = response.text
-        if '```json' in response_text:
-            response_text = response_text.split('```json')[1].split('```')[0]
-        return json.loads(response_text)["precautions"]
+        response = safe_generate_content(get_gemini_model(), prompt)
+        # Match names case-insensitively in case the model changes their capitalization
+        results = {name.strip().lower(): items for name, items in parse_json_response(response.text).items()}
     except Exception:
-        # Fallback precautions if API fails
-        fallback_precautions = {
-            "COVID-19": [
-                "Monitor for allergic reactions for 15-30 minutes after vaccination",
-                "Inform your doctor about any history of blood clotting disorders",
-                "Stay hydrated and rest after vaccination"
-            ],
-            "Flu": [
-                "Inform your doctor if you have egg allergies",
-                "Avoid vaccination if you currently have a fever",
-                "Mild flu-like symptoms are common for 1-2 days after vaccination"
-            ],
-            "default": [
-                "Consult your doctor before vaccination",
-                "Inform about any allergies or medical conditions",
-                "Stay at the clinic for observation for 15-30 minutes after vaccination"
-            ]
-        }
-        
-        return fallback_precautions.get(vaccine_name, fallback_precautions["default"])
+        results = {}
+    
+    for vaccine_name in missing:
+        items = results.get(vaccine_name.strip().lower())
+        if items:
+            get_disk_cache().set(precautions_cache_key(vaccine_name), items, expire=PRECAUTIONS_CACHE_EXPIRE)
+            precautions[vaccine_name] = items
+        else:
+            # Fallback precautions if API fails
+            precautions[vaccine_name] = FALLBACK_PRECAUTIONS.get(vaccine_name, FALLBACK_PRECAUTIONS["default"])
+    
+    return precautions
 
 def process_uploaded_file(uploaded_file):
     """Process uploaded vaccination card file with enhanced error handling"""
@@ -169,15 +270,17 @@ def process_uploaded_file(uploaded_file):
         if uploaded_file.type not in ["image/jpeg", "image/png"]:
             return {"error": "Only JPEG/PNG images are supported"}
         
-        st.image(file_bytes, caption="Uploaded Vaccination Card", use_column_width=True)
+        image = load_card_image(file_bytes)
+        st.image(image, caption="Uploaded Vaccination Card", width="stretch")
         
         with st.spinner("Analyzing vaccination card..."):
-            vaccine_data = extract_vaccination_data(file_bytes)
+            vaccine_data = extract_vaccination_data(st.session_state.img_key, image)
             if vaccine_data:
                 # Add precautions for due vaccines
                 if "due_vaccines" in vaccine_data:
+                    precautions = get_vaccine_precautions([vaccine["name"] for vaccine in vaccine_data["due_vaccines"]])
                     for vaccine in vaccine_data["due_vaccines"]:
-                        vaccine["precautions"] = get_vaccine_precautions(vaccine["name"])
+                        vaccine["precautions"] = precautions[vaccine["name"]]
                 
                 st.session_state.vaccination_data = vaccine_data
                 st.session_state.vaccination_card_processed = True
@@ -240,43 +343,22 @@ def render_sidebar():
                     if st.session_state.api_retry_count > 0:
                         st.info(f"Note: Some requests required retries due to API limits. Total retries: {st.session_state.api_retry_count}")
                     st.balloons()
+            elif "img_thumb" in st.session_state:
+                # Already processed: show the decoded thumbnail kept from the upload
+                st.image(st.session_state.img_thumb, caption="Uploaded Vaccination Card", width="stretch")
 
 def generate_chat_response(prompt):
-    """Generate appropriate response based on user prompt and available data"""
+    """Stream a response to the user prompt, based on available data, as text chunks"""
     current_date = time.strftime('%Y-%m-%d')
     
-    # System prompt for generic vaccination questions
-    generic_prompt = """
-    You are a Vaccination Expert Assistant with the following capabilities:
-    
-    1. For GENERAL vaccination questions (without personal data):
-    - Provide accurate, up-to-date information about vaccines
-    - Explain vaccine schedules, side effects, precautions
-    - Offer travel vaccination advice
-    - Compare different vaccine brands
-    - Explain vaccine efficacy and duration
-    
-    2. For PERSONALIZED questions (when vaccination card is uploaded):
-    - Answer based on the user's specific vaccination history
-    - Identify missing vaccines based on age/health conditions
-    - Calculate due dates for next doses
-    - Provide personalized precautions
-    
-    3. Response Guidelines:
-    - Be concise but thorough (3-5 sentences for most answers)
-    - Use bullet points for lists of side effects/precautions
-    - Always cite reputable sources when possible
-    - If unsure, recommend consulting a healthcare provider
-    - For age/condition specific advice, ask for clarification if needed
-    
-    Current Date: {current_date}
-    """
+    # Only the date changes between calls; the rest of the system prompt is a constant
+    generic_prompt = f"{CHAT_SYSTEM_PROMPT}\n    Current Date: {current_date}\n"
     
     if st.session_state.vaccination_card_processed:
         # Personalized response with vaccination data
         vaccination_context = f"""
         User's Vaccination Data:
-        {json.dumps(st.session_state.vaccination_data, indent=2)}
+        {orjson.dumps(st.session_state.vaccination_data).decode()}
         """
         
         full_prompt = f"{generic_prompt}\n\n{vaccination_context}\n\nQuestion: {prompt}"
@@ -285,11 +367,12 @@ def generate_chat_response(prompt):
         full_prompt = f"{generic_prompt}\n\nQuestion: {prompt}"
     
     try:
-        response = safe_generate_content(text_model, full_prompt)
-        return response.text
+        for chunk in safe_generate_content(get_gemini_model(), full_prompt, stream=True):
+            yield chunk.text
     except Exception as e:
-        return f"Sorry, I'm having trouble answering right now. Please try again later. (Error: {str(e)})"
+        yield f"Sorry, I'm having trouble answering right now. Please try again later. (Error: {str(e)})"
 
+# Not a fragment: st.chat_input is only pinned to the bottom of the page when rendered outside a container
 def render_chat_interface():
     st.title("💉 Vaccination Assistance Chatbot")
     render_instructions()
@@ -306,11 +389,12 @@ def render_chat_interface():
             st.markdown(prompt)
         
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                response = generate_chat_response(prompt)
-                st.markdown(response)
-                st.session_state.messages.append({"role": "assistant", "content": response})
+            # Show the answer as it is generated; write_stream returns the full text once done
+            response = st.write_stream(generate_chat_response(prompt))
+            st.session_state.messages.append({"role": "assistant", "content": response})
+            del st.session_state.messages[:-MAX_CHAT_MESSAGES]
 
+@st.fragment
 def render_vaccination_details():
     if st.session_state.vaccination_card_processed:
         st.subheader("📋 Your Vaccination Records")
@@ -318,9 +402,11 @@ def render_vaccination_details():
         
         with st.expander("👤 Personal Information"):
             if "patient_info" in data:
-                st.write(f"**Name:** {data['patient_info'].get('name', 'N/A')}")
-                st.write(f"**Date of Birth:** {data['patient_info'].get('dob', 'N/A')}")
-                st.write(f"**Patient ID:** {data['patient_info'].get('patient_id', 'N/A')}")
+                st.markdown(
+                    f"**Name:** {data['patient_info'].get('name', 'N/A')}\n\n"
+                    f"**Date of Birth:** {data['patient_info'].get('dob', 'N/A')}\n\n"
+                    f"**Patient ID:** {data['patient_info'].get('patient_id', 'N/A')}"
+                )
         
         with st.expander("💉 Vaccination History"):
             if "vaccines_received" in data and data["vaccines_received"]: